@@ -1,62 +1,52 @@
+import gc
 import gzip
 import pathlib
 from collections import defaultdict
 from contextlib import contextmanager
 
-import jsonlines
+import orjson
 from typing import Union, Literal
 
 from hub.dataload.utils.flatten_publication import process_publications
 from hub.dataload.utils.process_category import process_category
 from hub.dataload.utils.process_predicate import process_predicate
 
-NODE_BUFFER_SIZE = 4096
-EDGE_BUFFER_SIZE = 2048
 
 @contextmanager
-def gz_open(path: Union[str, pathlib.Path]):
-    """Open a gzipped JSONL file with jsonlines.Reader."""
-    with gzip.open(path, "rt") as f:
-        reader = jsonlines.Reader(f)
-        try:
-            yield reader
-        finally:
-            reader.close()
-
-
-def buffered_yield(size: int):
-    """Wraps any generator to yield items in batches of `size`."""
-    def wrapper(generator_function):
-        def wrapped(*args, **kwargs):
-            buffer = []
-            for item in generator_function(*args, **kwargs):
-                buffer.append(item)
-                if len(buffer) == size:
-                    yield from buffer
-                    buffer = []
-
-            if len(buffer) > 0:
-                yield from buffer
-        return wrapped
-    return wrapper
-
-
-
-@buffered_yield(NODE_BUFFER_SIZE)
+def paused_gc():
+    """ Pause cyclic garbage collection while building large in-memory lookups.
+
+    Parsed JSON docs cannot form reference cycles, yet every few thousand new
+    containers trigger a collection that walks the whole growing lookup.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
 def read_jsonl(input_file: Union[str, pathlib.Path]):
     """ Common reader to load data from jsonl files """
 
     gzip_file = input_file.with_name(input_file.name + ".gz")
 
-    file_loader = jsonlines.open
+    file_loader = open
 
     if pathlib.Path(gzip_file).exists():
         input_file = gzip_file
-        file_loader = gz_open
+        file_loader = gzip.open
 
-    with file_loader(input_file) as source:
+    # read raw bytes, orjson parses them directly without a text decoding step
+    with file_loader(input_file, "rb") as source:
         index = 0
-        for doc in source:
+        for line in source:
+            if line.isspace():
+                continue
+
+            doc = orjson.loads(line)
             if doc:
                 # doc["_id"] = doc["id"] if "id" in doc else str(index)
                 index += 1
@@ -82,38 +72,74 @@ def load_nodes(data_folder: Union[str, pathlib.Path]):
 
 
 
-@buffered_yield(EDGE_BUFFER_SIZE)
 def load_merged_edges(data_folder: Union[str, pathlib.Path]):
     """ Generate merged edge data"""
 
-    # use loaded node info as reference dict
-    nodes = {node['id']: node for node in load_nodes(data_folder)}
-
     predicate_cache = {}
     category_cache = {}
 
-    index = 0
-    for edge in load_edges(data_folder):
-        process_publications(edge)
+    # use loaded node info as reference dict
+    # node categories are processed once here rather than once per referencing edge
+    # each node is kept as compact orjson bytes and only decoded for the edges yielded
+    nodes = {}
+    with paused_gc():
+        for node in load_nodes(data_folder):
+            process_category(node, category_cache)
+            # copy, as orjson output holds on to an oversized write buffer
+            nodes[node['id']] = bytes(memoryview(orjson.dumps(node)))
+
+    # bind everything used per edge to fast locals
+    nodes_get = nodes.get
+    loads = orjson.loads
+    publications_processor = process_publications
+    predicate_processor = process_predicate
+
+    for index, edge in enumerate(load_edges(data_folder)):
+        subject_node = nodes_get(edge["subject"])
+        object_node = nodes_get(edge["object"])
+
+        # skip dangling edges referring to unknown nodes
+        if subject_node is None or object_node is None:
+            continue
+
+        publications_processor(edge)
+        predicate_processor(edge, predicate_cache)
+
+        edge["subject"] = loads(subject_node)
+        edge["object"] = loads(object_node)
 
-        subject_id = edge["subject"]
-        object_id = edge["object"]
+        edge["_id"] = str(edge["id"]) if "id" in edge else str(index)
 
-        subject_node = nodes[subject_id]
-        object_node = nodes[object_id]
+        yield edge
 
-        process_predicate(edge, predicate_cache)
-        process_category(subject_node, category_cache)
-        process_category(object_node, category_cache)
 
-        edge["subject"] = subject_node
-        edge["object"] = object_node
+def load_merged_edges_from_mongo(edges_collection, nodes_collection):
+    """ Generate merged edge data by joining uploaded edge and node collections in MongoDB
 
-        edge["_id"] = str(edge["id"]) if "id" in edge else str(index)
-        index += 1
+    Both collections must live in the same database, nodes keyed by their id as `_id`
+    (as uploaded by the CEBS parser), so the join never holds the node table in memory.
+    """
+    pipeline = []
+    for field in ("subject", "object"):
+        pipeline.extend([
+            {"$lookup": {"from": nodes_collection.name, "localField": field, "foreignField": "_id", "as": field}},
+            # drops dangling edges, as load_merged_edges does
+            {"$unwind": f"${field}"},
+        ])
+    pipeline.append({"$unset": ["subject._id", "object._id"]})
+
+    predicate_cache = {}
+    category_cache = {}
+
+    for edge in edges_collection.aggregate(pipeline, allowDiskUse=True, batchSize=1000):
+        process_publications(edge)
+        process_predicate(edge, predicate_cache)
+        process_category(edge["subject"], category_cache)
+        process_category(edge["object"], category_cache)
 
         yield edge
 
+
 def build_node_edge_mapping(edges):
 
     # try to build
@@ -135,10 +161,10 @@ def build_node_edge_mapping(edges):
     return nodes_mapping, edges_mapping
 
 
-@buffered_yield(NODE_BUFFER_SIZE)
 def load_adjacency_nodes(data_folder: Union[str, pathlib.Path]):
     # get reference mappings
-    nodes_mapping, edges_mapping = build_node_edge_mapping(load_edges(data_folder))
+    with paused_gc():
+        nodes_mapping, edges_mapping = build_node_edge_mapping(load_edges(data_folder))
     for node in load_nodes(data_folder):
         node_id = node["_id"]
 
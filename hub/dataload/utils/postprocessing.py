@@ -1,11 +1,13 @@
+import functools
+
 import bmt
 
 biolink = bmt.Toolkit()
 
+# the biolink vocabulary is small, so stripped terms are memoized
+@functools.lru_cache(maxsize=4096)
 def remove_single_biolink_prefix(text:str):
-    if text.startswith("biolink:"):
-        return text[8:]
-    return text
+    return text.removeprefix("biolink:")
 
 def remove_biolink_prefix(target: str | list):
     if type(target) is str:
@@ -21,8 +23,9 @@ def get_ancestors(phrase: str, cache: dict):
 
     if ancestors:
         # ancestors = ['_'.join(item.split(' ')) for item in ancestors]
-        ancestors = [remove_biolink_prefix(item) for item in ancestors]
+        ancestors = [remove_single_biolink_prefix(item) for item in ancestors]
 
+    # cache the stripped list so repeated hits need no further work
     cache[phrase] = ancestors
 
     return ancestors
\ No newline at end of file
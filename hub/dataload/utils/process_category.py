@@ -2,12 +2,15 @@ from hub.dataload.utils.postprocessing import get_ancestors, remove_biolink_pref
 
 
 def process_categories(categories:list, category_cache: dict):
-    ancestor_set = set()
-    for category in categories:
-        ancestors = get_ancestors(category, category_cache)
-        ancestor_set.update(ancestors)
+    # few distinct category combinations exist in a KG, so the merged ancestors
+    # are cached under the tuple of categories next to the per-category entries
+    key = tuple(categories)
+    ancestors = category_cache.get(key)
+    if ancestors is None:
+        ancestor_set = set().union(*(get_ancestors(category, category_cache) or () for category in categories))
+        ancestors = category_cache[key] = list(ancestor_set)
 
-    return list(ancestor_set)
+    return ancestors
 
 
 def process_category(node, category_cache: dict):
@@ -20,13 +23,10 @@ def process_category(node, category_cache: dict):
     if all_categories:
         reference = all_categories
 
-    ancestors = []
-    if type(reference) == list:
-        ancestors = process_categories(reference, category_cache)
-    elif type(reference) == str:
-        ancestors = get_ancestors(reference, category_cache)
+    # normalize to a list so single and multiple categories share one path
+    reference = [reference] if isinstance(reference, str) else reference or []
 
-    node["all_categories"] = ancestors
+    node["all_categories"] = process_categories(reference, category_cache)
 
     if category:
         node["category"] = remove_biolink_prefix(category)
\ No newline at end of file
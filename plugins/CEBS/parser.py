@@ -2,25 +2,11 @@ import pathlib
 import jsonlines
 from typing import Union
 
-BUFFER_SIZE = 4096
-
 def read_jsonl(input_file: Union[str, pathlib.Path]):
     with jsonlines.open(input_file) as source:
-        buffer = []
-        index = 0
-        for doc in source:
-            buffer.append(doc)
-
+        for index, doc in enumerate(source):
             doc["_id"] = doc["id"] if "id" in doc else str(index)
-
-            if len(buffer) == BUFFER_SIZE:
-                yield from buffer
-                buffer = []
-
-            index += 1
-
-        if len(buffer) > 0:
-            yield from buffer
+            yield doc
 
 
 def load_edges(data_folder: Union[str, pathlib.Path]):